@@ -0,0 +1,165 @@
+#!/usr/bin/env node
+/* global process */
+
+/**
+ * Run ESLint and Prettier in a single Node process over one file walk.
+ * Used by make_lint.py; prints a JSON report with one entry per tool.
+ *
+ * ESLint and Prettier results are cached per file (.eslintcache, .prettiercache)
+ * so unchanged files are skipped on repeat runs; pass --no-cache to disable.
+ *
+ * Usage: node scripts/lint.js [--fix] [--no-cache]
+ */
+
+import { readdir, readFile, stat, writeFile } from "fs/promises";
+import path from "path";
+import eslintPkg from "eslint";
+import * as prettier from "prettier";
+
+const { loadESLint } = eslintPkg;
+
+const root = process.cwd();
+const fix = process.argv.includes("--fix");
+const useCache = !process.argv.includes("--no-cache");
+
+const ESLINT_EXTENSIONS = new Set([".ts", ".tsx", ".js", ".jsx"]);
+// Dependency trees and build output are never linted (tsconfig.json excludes the same
+// output dirs), so don't walk them at all; make_lint.py's manifest skips these too
+const SKIP_DIRS = new Set(["node_modules", ".git", "dist", "build", "__pycache__", "venv", ".venv"]);
+const PRETTIER_IGNORE_FILES = [".gitignore", ".prettierignore"];
+const ESLINT_CACHE_FILE = ".eslintcache";
+const PRETTIER_CACHE_FILE = ".prettiercache";
+
+async function walk(dir, files = []) {
+  const entries = await readdir(dir, { withFileTypes: true });
+  for (const entry of entries) {
+    const fullPath = path.join(dir, entry.name);
+    if (entry.isDirectory()) {
+      if (!SKIP_DIRS.has(entry.name)) await walk(fullPath, files);
+    } else if (entry.isFile()) {
+      files.push(fullPath);
+    }
+  }
+  return files;
+}
+
+async function runEslint(files) {
+  const ESLint = await loadESLint();
+  const eslint = new ESLint({
+    cwd: root,
+    fix,
+    cache: useCache,
+    cacheLocation: path.join(root, ESLINT_CACHE_FILE),
+  });
+
+  const targets = [];
+  for (const file of files) {
+    if (ESLINT_EXTENSIONS.has(path.extname(file)) && !(await eslint.isPathIgnored(file))) {
+      targets.push(file);
+    }
+  }
+
+  const results = targets.length > 0 ? await eslint.lintFiles(targets) : [];
+  if (fix) await ESLint.outputFixes(results);
+
+  const formatter = await eslint.loadFormatter("stylish");
+  const errorCount = results.reduce((sum, r) => sum + r.errorCount, 0);
+  const warningCount = results.reduce((sum, r) => sum + r.warningCount, 0);
+
+  return {
+    success: errorCount === 0,
+    errorCount,
+    warningCount,
+    output: await formatter.format(results),
+  };
+}
+
+// Prettier's API has no cache, so keep one keyed by file metadata like its CLI
+// `--cache-strategy metadata`. It is dropped when Prettier or its config changes.
+async function loadPrettierCache() {
+  const configFile = await prettier.resolveConfigFile(path.join(root, "package.json"));
+  const config = configFile ? await readFile(configFile, "utf8") : "";
+  const key = `${prettier.version}:${config}`;
+
+  if (useCache) {
+    try {
+      const cache = JSON.parse(await readFile(path.join(root, PRETTIER_CACHE_FILE), "utf8"));
+      if (cache.key === key) return { key, files: cache.files };
+    } catch {
+      // Missing or unreadable cache; start fresh
+    }
+  }
+  return { key, files: {} };
+}
+
+async function fileSignature(file) {
+  const info = await stat(file);
+  return `${info.mtimeMs}:${info.size}`;
+}
+
+async function runPrettier(files) {
+  const unformatted = [];
+  const errors = [];
+  const cache = await loadPrettierCache();
+  const formattedFiles = {};
+
+  for (const file of files) {
+    const relativePath = path.relative(root, file);
+    try {
+      const signature = await fileSignature(file);
+      if (cache.files[relativePath] === signature) {
+        formattedFiles[relativePath] = signature;
+        continue;
+      }
+
+      const info = await prettier.getFileInfo(file, {
+        ignorePath: PRETTIER_IGNORE_FILES,
+        resolveConfig: true,
+      });
+      if (info.ignored || !info.inferredParser) continue;
+
+      const source = await readFile(file, "utf8");
+      const options = { ...(await prettier.resolveConfig(file)), filepath: file };
+
+      if (fix) {
+        const formatted = await prettier.format(source, options);
+        if (formatted !== source) await writeFile(file, formatted);
+        formattedFiles[relativePath] = await fileSignature(file);
+      } else if (await prettier.check(source, options)) {
+        formattedFiles[relativePath] = signature;
+      } else {
+        unformatted.push(relativePath);
+      }
+    } catch (err) {
+      errors.push(`${relativePath}: ${err.message}`);
+    }
+  }
+
+  if (useCache) {
+    await writeFile(
+      path.join(root, PRETTIER_CACHE_FILE),
+      JSON.stringify({ key: cache.key, files: formattedFiles }),
+    );
+  }
+
+  return { success: unformatted.length === 0 && errors.length === 0, unformatted, errors };
+}
+
+async function main() {
+  const files = await walk(root);
+
+  // ESLint fixes first so Prettier has the final say on formatting
+  const eslint = await runEslint(files);
+  const prettierResult = await runPrettier(files);
+
+  // The report goes last, on its own line, so make_lint.py can parse it even if a
+  // plugin logged to stdout first. Set exitCode rather than calling process.exit()
+  // so a large report is fully flushed to the pipe before Node exits
+  process.stdout.write(`${JSON.stringify({ eslint, prettier: prettierResult })}\n`);
+  process.exitCode = eslint.success && prettierResult.success ? 0 : 1;
+}
+
+main().catch((err) => {
+  process.stderr.write(`${err.stack || err}\n`);
+  process.exitCode = 2;
+});
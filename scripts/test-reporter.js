@@ -0,0 +1,36 @@
+/**
+ * Node test runner reporter used by make_lint.py.
+ *
+ * Groups results by suite file, which the runner reports on every event, so plain
+ * script suites and node:test suites (whose tests are named after each test()
+ * call) are both attributed correctly. Emits one JSON line at the end:
+ * { "<file>": { "passed": n, "failed": n, "output": [lines] } }
+ *
+ * Usage: node --test --test-reporter=./scripts/test-reporter.js <files>
+ */
+
+export default async function* testReporter(source) {
+  const suites = new Map();
+  const suiteFor = (file) => {
+    if (!suites.has(file)) suites.set(file, { passed: 0, failed: 0, output: [] });
+    return suites.get(file);
+  };
+
+  for await (const { type, data } of source) {
+    if (!data?.file) continue;
+
+    if (type === "test:pass" && data.nesting === 0) {
+      suiteFor(data.file).passed += 1;
+    } else if (type === "test:fail") {
+      const suite = suiteFor(data.file);
+      // Only top-level tests count toward the suite; nested failures add detail
+      if (data.nesting === 0) suite.failed += 1;
+      const error = data.details?.error;
+      suite.output.push(`${data.name}: ${error?.cause?.message ?? error?.message ?? "failed"}`);
+    } else if (type === "test:stdout" || type === "test:stderr") {
+      suiteFor(data.file).output.push(data.message.replace(/\n$/, ""));
+    }
+  }
+
+  yield `${JSON.stringify(Object.fromEntries(suites))}\n`;
+}